@@ -1,8 +1,18 @@
-import sys
+import argparse
 import json
+import os
+import sys
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QSettings,
+    QThread,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -20,24 +30,86 @@ from PyQt6.QtWidgets import (
     QSpinBox,
     QCheckBox,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QComboBox,
     QStackedWidget,
 )
 
-from utils import load_csv, send_emails, validate_email_settings
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+from utils import (
+    DEFAULT_WORKERS,
+    compile_template,
+    load_csv,
+    send_emails,
+    summarize_failures,
+    validate_email_settings,
+)
+
+# Service name for passwords kept in the OS keyring
+KEYRING_SERVICE = "mass_email_sender"
+
+
+class MessageBoxMixin:
+    """Reuse one message box per severity instead of creating one per message"""
+
+    def _show_message(self, icon, title, text):
+        try:
+            boxes = self._message_boxes
+        except AttributeError:
+            boxes = self._message_boxes = {}
+
+        box = boxes.get(icon)
+        if box is None:
+            box = boxes[icon] = QMessageBox(icon, "", "", parent=self)
+        elif box.isVisible():
+            # Still showing an earlier message, use a one-off box for this one
+            box = QMessageBox(icon, "", "", parent=self)
+            box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec()
+
+    def _info(self, title, text):
+        self._show_message(QMessageBox.Icon.Information, title, text)
+
+    def _warning(self, title, text):
+        self._show_message(QMessageBox.Icon.Warning, title, text)
 
+    def _critical(self, title, text):
+        self._show_message(QMessageBox.Icon.Critical, title, text)
 
-class SettingsWidget(QWidget):
+
+class SettingsWidget(MessageBoxMixin, QWidget):
     """Settings tab for email configuration"""
 
+    # Provider combo box text -> stored provider key
+    _PROVIDER_MAP = {"SMTP": "smtp", "AWS SES": "ses"}
+
     def __init__(self):
         super().__init__()
-        # Use user's home directory for settings file
-        self.settings_file = Path.home() / ".mass_email_sender" / "email_settings.json"
-        # Create directory if it doesn't exist
-        self.settings_file.parent.mkdir(parents=True, exist_ok=True)
+        # Platform-native settings store (registry, plist or ini file)
+        self.settings = QSettings("mass_email_sender", "MassEmailSender")
+        # Provider settings returned by get_settings, rebuilt after any edit
+        self._settings_cache = None
+        # Values last written to (or read from) the settings store
+        self._last_saved = None
+        # AWS SES values, shown once the SES page is first built
+        self._ses_built = False
+        self._ses_values = {
+            "aws_access_key": "",
+            "aws_secret_key": "",
+            "aws_region": "us-east-1",
+            "ses_sender_email": "",
+        }
+        # Coalesce rapid save requests into a single write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._do_save)
         self.init_ui()
         self.load_settings()
 
@@ -120,7 +192,52 @@ class SettingsWidget(QWidget):
         smtp_page.setLayout(smtp_page_layout)
         self.provider_stack.addWidget(smtp_page)
 
-        # === AWS SES Settings Page ===
+        # AWS SES page is built the first time it is selected
+        self._ses_placeholder = QWidget()
+        self.provider_stack.addWidget(self._ses_placeholder)
+
+        layout.addWidget(self.provider_stack)
+
+        # Sending options shared by both providers
+        sending_group = QGroupBox("Sending Options")
+        sending_layout = QHBoxLayout()
+        sending_layout.addWidget(QLabel("Concurrent connections:"))
+        self.workers_input = QSpinBox()
+        self.workers_input.setRange(1, 20)
+        self.workers_input.setValue(DEFAULT_WORKERS)
+        sending_layout.addWidget(self.workers_input)
+        sending_layout.addWidget(QLabel("Max emails per second:"))
+        self.rate_limit_input = QSpinBox()
+        self.rate_limit_input.setRange(0, 1000)
+        self.rate_limit_input.setSpecialValueText("Unlimited")
+        self.rate_limit_input.setValue(0)
+        sending_layout.addWidget(self.rate_limit_input)
+        sending_layout.addStretch()
+        sending_group.setLayout(sending_layout)
+        layout.addWidget(sending_group)
+
+        # Save button
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        save_btn = QPushButton("Save Settings")
+        save_btn.clicked.connect(self.save_settings)
+        button_layout.addWidget(save_btn)
+        layout.addLayout(button_layout)
+
+        layout.addStretch()
+        self.setLayout(layout)
+
+        # Any edit invalidates the cached settings
+        self.provider_combo.currentIndexChanged.connect(self._invalidate)
+        for line_edit in (self.server_input, self.email_input, self.password_input):
+            line_edit.textChanged.connect(self._invalidate)
+        self.port_input.valueChanged.connect(self._invalidate)
+        self.tls_checkbox.toggled.connect(self._invalidate)
+        self.workers_input.valueChanged.connect(self._invalidate)
+        self.rate_limit_input.valueChanged.connect(self._invalidate)
+
+    def _build_ses_page(self):
+        """Create the AWS SES settings page and fill it with loaded values"""
         ses_page = QWidget()
         ses_page_layout = QVBoxLayout()
 
@@ -152,7 +269,6 @@ class SettingsWidget(QWidget):
         region_layout.addWidget(QLabel("AWS Region:"))
         self.aws_region_input = QLineEdit()
         self.aws_region_input.setPlaceholderText("us-east-1")
-        self.aws_region_input.setText("us-east-1")
         region_layout.addWidget(self.aws_region_input)
         aws_creds_layout.addLayout(region_layout)
 
@@ -175,55 +291,52 @@ class SettingsWidget(QWidget):
         ses_page_layout.addWidget(ses_sender_group)
         ses_page_layout.addStretch()
         ses_page.setLayout(ses_page_layout)
-        self.provider_stack.addWidget(ses_page)
 
-        layout.addWidget(self.provider_stack)
-
-        # Save button
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        save_btn = QPushButton("Save Settings")
-        save_btn.clicked.connect(self.save_settings)
-        button_layout.addWidget(save_btn)
-        layout.addLayout(button_layout)
-
-        layout.addStretch()
-        self.setLayout(layout)
+        self._apply_ses_values()
+        for line_edit in (
+            self.aws_access_key_input,
+            self.aws_secret_key_input,
+            self.aws_region_input,
+            self.ses_sender_email_input,
+        ):
+            line_edit.textChanged.connect(self._invalidate)
+        return ses_page
+
+    def _apply_ses_values(self):
+        """Copy loaded AWS SES values into the SES page widgets"""
+        self.aws_access_key_input.setText(self._ses_values["aws_access_key"])
+        self.aws_secret_key_input.setText(self._ses_values["aws_secret_key"])
+        self.aws_region_input.setText(self._ses_values["aws_region"])
+        self.ses_sender_email_input.setText(self._ses_values["ses_sender_email"])
+
+    def _invalidate(self):
+        """Drop cached settings after a widget changed"""
+        self._settings_cache = None
 
     def toggle_provider(self, index):
         """Switch between SMTP and AWS SES settings"""
+        if index == 1 and not self._ses_built:
+            ses_page = self._build_ses_page()
+            self.provider_stack.removeWidget(self._ses_placeholder)
+            self.provider_stack.insertWidget(1, ses_page)
+            self._ses_placeholder.deleteLater()
+            self._ses_placeholder = None
+            self._ses_built = True
         self.provider_stack.setCurrentIndex(index)
 
-    def get_settings(self):
-        """Return current settings as dictionary"""
-        provider = self.provider_combo.currentText()
-
-        if provider == "AWS SES":
-            return {
-                "provider": "ses",
+    def _collect_settings(self):
+        """Read all settings (both SMTP and SES) from the widgets"""
+        if self._ses_built:
+            ses_values = {
                 "aws_access_key": self.aws_access_key_input.text(),
                 "aws_secret_key": self.aws_secret_key_input.text(),
                 "aws_region": self.aws_region_input.text(),
-                "sender_email": self.ses_sender_email_input.text(),
+                "ses_sender_email": self.ses_sender_email_input.text(),
             }
         else:
-            return {
-                "provider": "smtp",
-                "smtp_server": self.server_input.text(),
-                "smtp_port": self.port_input.value(),
-                "use_tls": self.tls_checkbox.isChecked(),
-                "sender_email": self.email_input.text(),
-                "sender_password": self.password_input.text(),
-            }
-
-    def save_settings(self):
-        """Save settings to file"""
-        # Save all settings (both SMTP and SES) for persistence
-        settings = {
-            "provider": self.provider_combo.currentText()
-            .lower()
-            .replace(" ", "")
-            .replace("aws", ""),
+            ses_values = self._ses_values
+        return {
+            "provider": self._PROVIDER_MAP[self.provider_combo.currentText()],
             # SMTP settings
             "smtp_server": self.server_input.text(),
             "smtp_port": self.port_input.value(),
@@ -231,48 +344,287 @@ class SettingsWidget(QWidget):
             "sender_email": self.email_input.text(),
             "sender_password": self.password_input.text(),
             # AWS SES settings
-            "aws_access_key": self.aws_access_key_input.text(),
-            "aws_secret_key": self.aws_secret_key_input.text(),
-            "aws_region": self.aws_region_input.text(),
-            "ses_sender_email": self.ses_sender_email_input.text(),
+            **ses_values,
+            # Sending options
+            "workers": self.workers_input.value(),
+            "rate_limit": self.rate_limit_input.value(),
         }
+
+    @staticmethod
+    def _provider_settings(values):
+        """Reduce collected settings to those of the selected provider"""
+        if values["provider"] == "ses":
+            return {
+                "provider": "ses",
+                "aws_access_key": values["aws_access_key"],
+                "aws_secret_key": values["aws_secret_key"],
+                "aws_region": values["aws_region"],
+                "sender_email": values["ses_sender_email"],
+                "workers": values["workers"],
+                "rate_limit": values["rate_limit"],
+            }
+        else:
+            return {
+                "provider": "smtp",
+                "smtp_server": values["smtp_server"],
+                "smtp_port": values["smtp_port"],
+                "use_tls": values["use_tls"],
+                "sender_email": values["sender_email"],
+                "sender_password": values["sender_password"],
+                "workers": values["workers"],
+                "rate_limit": values["rate_limit"],
+            }
+
+    def get_settings(self):
+        """Return current settings as dictionary"""
+        if self._settings_cache is None:
+            self._settings_cache = self._provider_settings(self._collect_settings())
+        return dict(self._settings_cache)
+
+    def save_settings(self):
+        """Schedule a save, restarting the delay if one is already pending"""
+        self._save_timer.start()
+
+    def flush_pending_save(self):
+        """Run a scheduled save right away instead of waiting for the timer"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save(notify=False)
+
+    def _save_secret(self, key, username, secret):
+        """Store a secret in the OS keyring, falling back to the settings store
+
+        Args:
+            key: Settings key within the current group
+            username: Account the secret belongs to (sender email or access key)
+            secret: Secret value to store
+        """
+        if keyring is not None and username:
+            account = f"{self.settings.group()}:{username}"
+            try:
+                keyring.set_password(KEYRING_SERVICE, account, secret)
+            except Exception:
+                # Missing or locked backend (D-Bus, Windows API errors, ...)
+                pass
+            else:
+                # Don't leave a plaintext copy behind
+                self.settings.remove(key)
+                return
+        self.settings.setValue(key, secret)
+
+    def _load_secret(self, key, username):
+        """
+        Read a secret from the settings store or the OS keyring
+
+        A plaintext secret left in the settings store is moved to the keyring.
+        """
+        secret = self.settings.value(key, "", type=str)
+        if keyring is None or not username:
+            return secret
+        if secret:
+            self._save_secret(key, username, secret)
+            return secret
+        account = f"{self.settings.group()}:{username}"
+        try:
+            return keyring.get_password(KEYRING_SERVICE, account) or ""
+        except Exception:
+            return ""
+
+    def _do_save(self, notify=True):
+        """
+        Save settings to the platform settings store
+
+        Args:
+            notify: Show the result in a message box (off while closing)
+        """
+        # Save all settings (both SMTP and SES) for persistence
+        values = self._collect_settings()
         try:
-            with open(self.settings_file, "w") as f:
-                json.dump(settings, f, indent=2)
-            QMessageBox.information(self, "Success", "Settings saved successfully!")
+            if values != self._last_saved:
+                self._write_settings(values)
+                self._last_saved = values
+                self._settings_cache = self._provider_settings(values)
+            # else nothing changed since the last save, skip the write
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
+            if notify:
+                self._critical("Error", f"Failed to save settings: {str(e)}")
+            else:
+                print(f"Failed to save settings: {e}")
+            return
+        if notify:
+            self._info("Success", "Settings saved successfully!")
+
+    def _write_settings(self, values):
+        """Write collected settings to the settings store and sync it"""
+        settings = self.settings
+        settings.setValue("provider", values["provider"])
+        settings.setValue("workers", values["workers"])
+        settings.setValue("rate_limit", values["rate_limit"])
+
+        # SMTP settings
+        settings.beginGroup("smtp")
+        try:
+            settings.setValue("server", values["smtp_server"])
+            settings.setValue("port", values["smtp_port"])
+            settings.setValue("use_tls", values["use_tls"])
+            settings.setValue("sender_email", values["sender_email"])
+            self._save_secret(
+                "sender_password",
+                values["sender_email"],
+                values["sender_password"],
+            )
+        finally:
+            settings.endGroup()
+
+        # AWS SES settings
+        settings.beginGroup("ses")
+        try:
+            settings.setValue("access_key", values["aws_access_key"])
+            self._save_secret(
+                "secret_key",
+                values["aws_access_key"],
+                values["aws_secret_key"],
+            )
+            settings.setValue("region", values["aws_region"])
+            settings.setValue("sender_email", values["ses_sender_email"])
+        finally:
+            settings.endGroup()
+
+        settings.sync()
+        if settings.status() != QSettings.Status.NoError:
+            raise OSError(f"settings store error ({settings.status().name})")
+
+    def _import_legacy_settings(self):
+        """Move settings from the JSON file of earlier versions into the store"""
+        try:
+            legacy_file = Path.home() / ".mass_email_sender" / "email_settings.json"
+            with open(legacy_file, "r") as f:
+                legacy = json.load(f)
+        except (RuntimeError, FileNotFoundError):
+            # No home directory, or nothing to import
+            return
+
+        # Only import into an empty store, never over newer settings
+        if not self.settings.contains("provider"):
+            values = {
+                "provider": "smtp",
+                "smtp_server": "",
+                "smtp_port": 587,
+                "use_tls": True,
+                "sender_email": "",
+                "sender_password": "",
+                "aws_access_key": "",
+                "aws_secret_key": "",
+                "aws_region": "us-east-1",
+                "ses_sender_email": "",
+                "workers": DEFAULT_WORKERS,
+                "rate_limit": 0,
+            }
+            values.update((k, v) for k, v in legacy.items() if k in values)
+            self._write_settings(values)
+
+        # The file holds plaintext credentials, don't leave it behind
+        legacy_file.unlink()
+        try:
+            legacy_file.parent.rmdir()
+        except OSError:
+            pass
 
     def load_settings(self):
-        """Load settings from file"""
-        if self.settings_file.exists():
+        """Load settings from the platform settings store"""
+        try:
+            self._import_legacy_settings()
+        except Exception as e:
+            print(f"Failed to import legacy settings: {e}")
+
+        settings = self.settings
+        try:
+            # SMTP settings
+            settings.beginGroup("smtp")
             try:
-                with open(self.settings_file, "r") as f:
-                    settings = json.load(f)
-
-                # Set provider
-                provider = settings.get("provider", "smtp")
-                if provider == "ses":
-                    self.provider_combo.setCurrentIndex(1)
-                else:
-                    self.provider_combo.setCurrentIndex(0)
-
-                # SMTP settings
-                self.server_input.setText(settings.get("smtp_server", ""))
-                self.port_input.setValue(settings.get("smtp_port", 587))
-                self.tls_checkbox.setChecked(settings.get("use_tls", True))
-                self.email_input.setText(settings.get("sender_email", ""))
-                self.password_input.setText(settings.get("sender_password", ""))
-
-                # AWS SES settings
-                self.aws_access_key_input.setText(settings.get("aws_access_key", ""))
-                self.aws_secret_key_input.setText(settings.get("aws_secret_key", ""))
-                self.aws_region_input.setText(settings.get("aws_region", "us-east-1"))
-                self.ses_sender_email_input.setText(
-                    settings.get("ses_sender_email", "")
+                self.server_input.setText(settings.value("server", "", type=str))
+                self.port_input.setValue(settings.value("port", 587, type=int))
+                self.tls_checkbox.setChecked(settings.value("use_tls", True, type=bool))
+                sender_email = settings.value("sender_email", "", type=str)
+                self.email_input.setText(sender_email)
+                self.password_input.setText(
+                    self._load_secret("sender_password", sender_email)
                 )
-            except Exception as e:
-                print(f"Failed to load settings: {e}")
+            finally:
+                settings.endGroup()
+
+            # AWS SES settings
+            settings.beginGroup("ses")
+            try:
+                access_key = settings.value("access_key", "", type=str)
+                self._ses_values = {
+                    "aws_access_key": access_key,
+                    "aws_secret_key": self._load_secret("secret_key", access_key),
+                    "aws_region": settings.value("region", "us-east-1", type=str),
+                    "ses_sender_email": settings.value("sender_email", "", type=str),
+                }
+            finally:
+                settings.endGroup()
+            if self._ses_built:
+                self._apply_ses_values()
+
+            # Sending options
+            self.workers_input.setValue(
+                settings.value("workers", DEFAULT_WORKERS, type=int)
+            )
+            self.rate_limit_input.setValue(settings.value("rate_limit", 0, type=int))
+
+            # Set provider (builds the SES page if it is selected)
+            provider = settings.value("provider", "smtp", type=str)
+            if provider == "ses":
+                self.provider_combo.setCurrentIndex(1)
+            else:
+                self.provider_combo.setCurrentIndex(0)
+
+            # Write out any secrets moved to the keyring
+            settings.sync()
+            self._last_saved = self._collect_settings()
+        except Exception as e:
+            print(f"Failed to load settings: {e}")
+
+
+class RecipientModel(QAbstractTableModel):
+    """Read-only table model showing a recipients DataFrame"""
+
+    _COLUMNS = ("email", "first_name", "last_name")
+    _HEADERS = ("Email", "First Name", "Last Name")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_count = 0
+        self._columns = ()
+
+    def set_recipients(self, recipients):
+        """Show a new DataFrame, keeping a reference to each column"""
+        self.beginResetModel()
+        self._row_count = recipients.height
+        self._columns = [recipients.get_column(name) for name in self._COLUMNS]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Cells are read on demand, so only visible rows are ever fetched
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._columns[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self._HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class EmailThread(QThread):
@@ -290,24 +642,32 @@ class EmailThread(QThread):
 
     def run(self):
         try:
-            send_emails(
+            result = send_emails(
                 self.recipients,
                 self.subject,
                 self.body_template,
                 self.settings,
                 self.progress,
             )
+            failed = result["failed"]
+            if not failed:
+                self.finished.emit(True, f"Successfully sent {result['sent']} emails!")
+                return
+
             self.finished.emit(
-                True, f"Successfully sent {len(self.recipients)} emails!"
+                False,
+                f"Sent {result['sent']}/{self.recipients.height} emails; "
+                f"{len(failed)} failed:\n" + summarize_failures(failed),
             )
         except Exception as e:
             self.finished.emit(False, f"Error sending emails: {str(e)}")
 
 
-class MainWindow(QMainWindow):
+class MainWindow(MessageBoxMixin, QMainWindow):
     def __init__(self):
         super().__init__()
-        self.recipients = []
+        # Recipients DataFrame from load_csv (email, first_name, last_name)
+        self.recipients = None
         self.init_ui()
 
     def init_ui(self):
@@ -346,11 +706,9 @@ class MainWindow(QMainWindow):
         preview_group = QGroupBox("Recipients Preview")
         preview_layout = QVBoxLayout()
 
-        self.recipients_table = QTableWidget()
-        self.recipients_table.setColumnCount(3)
-        self.recipients_table.setHorizontalHeaderLabels(
-            ["Email", "First Name", "Last Name"]
-        )
+        self.recipients_model = RecipientModel(self)
+        self.recipients_table = QTableView()
+        self.recipients_table.setModel(self.recipients_model)
         self.recipients_table.setMaximumHeight(150)
         preview_layout.addWidget(self.recipients_table)
 
@@ -422,104 +780,110 @@ class MainWindow(QMainWindow):
     def load_csv(self, file_path):
         """Load and parse CSV file"""
         try:
-            self.recipients = load_csv(file_path)
+            recipients = load_csv(file_path)
 
-            if not self.recipients:
-                QMessageBox.warning(
-                    self, "Warning", "No valid recipients found in CSV file."
-                )
+            if recipients.is_empty():
+                self._warning("Warning", "No valid recipients found in CSV file.")
                 return
+            self.recipients = recipients
 
             # Update UI
-            self.csv_label.setText(Path(file_path).name)
+            self.csv_label.setText(os.path.basename(file_path))
             self.recipients_count_label.setText(
-                f"Loaded {len(self.recipients)} recipients"
+                f"Loaded {recipients.height} recipients"
             )
 
             # Update table preview
-            self.recipients_table.setRowCount(min(5, len(self.recipients)))
-            for i, recipient in enumerate(self.recipients[:5]):
-                self.recipients_table.setItem(
-                    i, 0, QTableWidgetItem(recipient["email"])
-                )
-                self.recipients_table.setItem(
-                    i, 1, QTableWidgetItem(recipient["first_name"])
-                )
-                self.recipients_table.setItem(
-                    i, 2, QTableWidgetItem(recipient["last_name"])
-                )
-
+            self.recipients_model.set_recipients(recipients)
             self.recipients_table.resizeColumnsToContents()
 
-            QMessageBox.information(
-                self,
+            self._info(
                 "Success",
-                f"Successfully loaded {len(self.recipients)} recipients!\n\n"
+                f"Successfully loaded {recipients.height} recipients!\n\n"
                 f"Required columns found: email, first_name, last_name",
             )
 
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load CSV: {str(e)}")
+            self._critical("Error", f"Failed to load CSV: {str(e)}")
 
     def send_emails(self):
-        """Validate and send emails"""
-        # Validation
-        if not self.recipients:
-            QMessageBox.warning(self, "Warning", "Please upload a CSV file first.")
+        """Validate, confirm and send emails"""
+        settings, error = self._prepare_send()
+        if error:
+            self._warning(*error)
             return
 
-        if not self.subject_input.text().strip():
-            QMessageBox.warning(self, "Warning", "Please enter an email subject.")
+        # Confirm send
+        reply = QMessageBox.question(
+            self,
+            "Confirm Send",
+            f"Send email to {self.recipients.height} recipients?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+
+        if reply == QMessageBox.StandardButton.No:
             return
 
+        self._start_send(settings)
+
+    def _prepare_send(self):
+        """
+        Validate recipients, composed email and settings without any dialogs
+
+        Returns:
+            tuple: (settings, None) or (None, (title, error_message))
+        """
+        if self.recipients is None or self.recipients.is_empty():
+            return None, ("Warning", "Please upload a CSV file first.")
+
+        if not self.subject_input.text().strip():
+            return None, ("Warning", "Please enter an email subject.")
+
         if not self.body_input.toPlainText().strip():
-            QMessageBox.warning(self, "Warning", "Please enter email body.")
-            return
+            return None, ("Warning", "Please enter email body.")
 
         settings = self.settings_widget.get_settings()
 
         # Validate settings
         is_valid, error_msg = validate_email_settings(settings)
         if not is_valid:
-            QMessageBox.warning(
-                self,
+            return None, (
                 "Settings Required",
                 f"{error_msg}\n\nPlease configure your email settings in the Settings tab.",
             )
-            return
 
-        # Confirm send
-        reply = QMessageBox.question(
-            self,
-            "Confirm Send",
-            f"Send email to {len(self.recipients)} recipients?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        )
-
-        if reply == QMessageBox.StandardButton.No:
-            return
+        return settings, None
 
-        # Start sending
+    def _start_send(self, settings, on_finished=None):
+        """Start the sending thread without asking for confirmation"""
         self.send_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        self.progress_bar.setMaximum(len(self.recipients))
+        self.progress_bar.setMaximum(self.recipients.height)
 
         # Create and start thread
         self.email_thread = EmailThread(
             self.recipients,
             self.subject_input.text(),
-            self.body_input.toPlainText(),
+            compile_template(self.body_input.toPlainText()),
             settings,
         )
         self.email_thread.progress.connect(self.update_progress)
-        self.email_thread.finished.connect(self.sending_finished)
+        self.email_thread.finished.connect(on_finished or self.sending_finished)
         self.email_thread.start()
+        return self.email_thread
+
+    def closeEvent(self, event):
+        """Don't drop a save still waiting on its debounce timer"""
+        self.settings_widget.flush_pending_save()
+        super().closeEvent(event)
 
     def update_progress(self, current, total, message):
         """Update progress bar"""
         self.progress_bar.setValue(current)
-        self.statusBar().showMessage(message)
+        # Refresh the status bar text every 10th update and at the end
+        if current == total or current % 10 == 0:
+            self.statusBar().showMessage(message)
 
     def sending_finished(self, success, message):
         """Handle sending completion"""
@@ -528,14 +892,65 @@ class MainWindow(QMainWindow):
         self.statusBar().clearMessage()
 
         if success:
-            QMessageBox.information(self, "Success", message)
+            self._info("Success", message)
         else:
-            QMessageBox.critical(self, "Error", message)
+            self._critical("Error", message)
+
+
+def parse_args():
+    """Parse command line options, leaving unknown ones for Qt"""
+    parser = argparse.ArgumentParser(description="Mass Email Sender")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="send without showing the window or asking for confirmation",
+    )
+    parser.add_argument("--csv", help="recipients CSV file (with --headless)")
+    parser.add_argument("--subject", help="email subject (with --headless)")
+    parser.add_argument("--body-file", help="email body text file (with --headless)")
+    args, qt_args = parser.parse_known_args()
+
+    if args.headless and not (args.csv and args.subject and args.body_file):
+        parser.error("--headless requires --csv, --subject and --body-file")
+    return args, qt_args
+
+
+def run_headless(app, window, args):
+    """Send emails using the saved settings, reporting to stdout"""
+    try:
+        window.recipients = load_csv(args.csv)
+        with open(args.body_file, "r", encoding="utf-8") as f:
+            window.body_input.setPlainText(f.read())
+    except Exception as e:
+        print(e)
+        return 1
+    window.subject_input.setText(args.subject)
+
+    settings, error = window._prepare_send()
+    if error:
+        print(f"{error[0]}: {error[1]}")
+        return 1
+
+    def finished(success, message):
+        print(message)
+        app.exit(0 if success else 1)
+
+    thread = window._start_send(settings, on_finished=finished)
+    thread.progress.connect(lambda current, total, message: print(message))
+    return app.exec()
 
 
 def main():
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args()
+    if args.headless:
+        # No window is shown, so do not require a display
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    app = QApplication(sys.argv[:1] + qt_args)
     window = MainWindow()
+    if args.headless:
+        sys.exit(run_headless(app, window, args))
+
     window.show()
     sys.exit(app.exec())
 
@@ -2,80 +2,165 @@
 Utility functions for Mass Email Sender application
 """
 
+import base64
+import queue
 import re
 import smtplib
+import threading
 import time
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from email.header import Header
+from email.policy import SMTP as SMTP_POLICY
 
 import polars as pl
 
+# Accepted email address format
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+# fullmatch also rejects a trailing newline, like the Polars filter does
+_EMAIL_MATCH = re.compile(EMAIL_PATTERN).fullmatch
+
+# Template variables replaced with recipient data
+_VAR_RE = re.compile(r"\{(email|first_name|last_name)\}")
+
+# Any line ending, normalized to CRLF in message bodies
+_EOL_RE = re.compile(r"\r\n|\r|\n")
+
+# Content headers for plain ASCII bodies and for base64-encoded UTF-8 bodies
+_ASCII_BODY_HEADERS = (
+    b'Content-Type: text/plain; charset="us-ascii"\r\n'
+    b"Content-Transfer-Encoding: 7bit\r\n"
+)
+_UTF8_BODY_HEADERS = (
+    b'Content-Type: text/plain; charset="utf-8"\r\n'
+    b"Content-Transfer-Encoding: base64\r\n"
+)
+
+# Accepted (lowercase) CSV header names for each required column
+COLUMN_ALIASES = {
+    "email": ("email", "e-mail", "email_address", "email address"),
+    "first_name": ("first_name", "firstname", "first name"),
+    "last_name": ("last_name", "lastname", "last name"),
+}
+
+# Looser rules for headers no alias matches: substrings that must all appear
+# in the lowercase header with non-alphanumerics removed
+_FALLBACK_COLUMN_RULES = {
+    "email": ("email",),
+    "first_name": ("first", "name"),
+    "last_name": ("last", "name"),
+}
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+# One recipient row, built on the fly while sending
+Recipient = namedtuple("Recipient", ["email", "first_name", "last_name"])
+
+# Parallel SMTP connections / SES sending threads
+DEFAULT_WORKERS = 5
+
+# SMTP replies that mean "try again later" and the retry delays in seconds
+TRANSIENT_SMTP_CODES = (421, 451, 452)
+BACKOFF_DELAYS = (0.5, 1, 2)
+
+# SMTP replies meaning the account can't send at all (authentication)
+FATAL_SMTP_CODES = (530, 535)
+
+# Reconnect after this many messages on one SMTP connection
+MESSAGES_PER_CONNECTION = 100
+
+# Check a connection with NOOP after it sat idle this many seconds
+IDLE_CHECK_SECONDS = 10
+
+# Messages built ahead of the SMTP sending threads
+SEND_QUEUE_SIZE = 64
+
+# Abort a batch once more than a third of at least this many sends failed
+ABORT_MIN_SENDS = 30
+
+# Most destinations AWS SES accepts in one send_bulk_templated_email call
+SES_BULK_LIMIT = 50
+
+# SES sends per second assumed when the account quota can't be read
+# (the sandbox limit)
+SES_DEFAULT_SEND_RATE = 1
+
 
 def load_csv(file_path):
     """
-    Load CSV file using polars and parse email, first_name, last_name columns
+    Scan CSV file using polars and parse email, first_name, last_name columns
 
     Args:
         file_path: Path to CSV file
 
     Returns:
-        List of dictionaries with email, first_name, last_name
+        Polars DataFrame with email, first_name, last_name columns
 
     Raises:
         ValueError: If required columns are missing
     """
     try:
-        # Read CSV with polars
-        df = pl.read_csv(file_path)
-
-        # Check for required columns (case-insensitive)
-        columns_lower = [col.lower() for col in df.columns]
-
-        # Map to find actual column names
-        email_col = None
-        first_name_col = None
-        last_name_col = None
-
-        for col in df.columns:
-            col_lower = col.lower()
-            if "email" in col_lower or col_lower == "e-mail":
-                email_col = col
-            elif (
-                "first" in col_lower and "name" in col_lower or col_lower == "firstname"
-            ):
-                first_name_col = col
-            elif "last" in col_lower and "name" in col_lower or col_lower == "lastname":
-                last_name_col = col
+        # Scan CSV lazily so only the needed columns are materialized; every
+        # column is read as a string, skipping schema inference
+        lf = pl.scan_csv(file_path, infer_schema=False, low_memory=True)
+        columns = lf.collect_schema().names()
+
+        # Resolve required columns by case-insensitive alias lookup
+        col_map = {col.lower(): col for col in columns}
+        resolved = {
+            name: next((col_map[alias] for alias in aliases if alias in col_map), None)
+            for name, aliases in COLUMN_ALIASES.items()
+        }
+
+        # Fall back to substring matching (e.g. "Work Email", "first-name")
+        # for anything the aliases missed
+        unresolved = {name for name, col in resolved.items() if col is None}
+        if unresolved:
+            used = set(resolved.values())
+            for col in columns:
+                if col in used:
+                    continue
+                normalized = _NON_ALNUM_RE.sub("", col.lower())
+                name = next(
+                    (
+                        name
+                        for name, parts in _FALLBACK_COLUMN_RULES.items()
+                        if all(part in normalized for part in parts)
+                    ),
+                    None,
+                )
+                if name in unresolved:
+                    # Later columns win, as with the original column scan
+                    resolved[name] = col
+        email_col = resolved["email"]
+        first_name_col = resolved["first_name"]
+        last_name_col = resolved["last_name"]
 
         # Check if all required columns found
-        missing = []
-        if not email_col:
-            missing.append("email")
-        if not first_name_col:
-            missing.append("first_name")
-        if not last_name_col:
-            missing.append("last_name")
-
+        missing = [name for name, col in resolved.items() if col is None]
         if missing:
             raise ValueError(
                 f"Missing required columns: {', '.join(missing)}\n"
-                f"Available columns: {', '.join(df.columns)}"
+                f"Available columns: {', '.join(columns)}"
             )
 
-        # Convert to list of dictionaries
-        recipients = []
-        for row in df.iter_rows(named=True):
-            email = str(row[email_col]).strip()
-            first_name = str(row[first_name_col]).strip()
-            last_name = str(row[last_name_col]).strip()
-
-            # Validate email format
-            if email and is_valid_email(email):
-                recipients.append(
-                    {"email": email, "first_name": first_name, "last_name": last_name}
-                )
+        # Keep the three columns as trimmed strings and drop invalid emails,
+        # streaming the file in chunks
+        df = (
+            lf.select(
+                pl.col(email_col).alias("email"),
+                pl.col(first_name_col).alias("first_name"),
+                pl.col(last_name_col).alias("last_name"),
+            )
+            .with_columns(
+                pl.col(c).str.strip_chars().fill_null("")
+                for c in ("email", "first_name", "last_name")
+            )
+            .filter(pl.col("email").str.contains(EMAIL_PATTERN))
+            .collect(engine="streaming")
+        )
 
-        return recipients
+        return df
 
     except Exception as e:
         raise Exception(f"Failed to load CSV: {str(e)}")
@@ -83,8 +168,7 @@ def load_csv(file_path):
 
 def is_valid_email(email):
     """Validate email format"""
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return re.match(pattern, email) is not None
+    return _EMAIL_MATCH(email) is not None
 
 
 def validate_email_settings(settings):
@@ -132,102 +216,465 @@ def validate_email_settings(settings):
     return True, None
 
 
+def compile_template(template):
+    """
+    Split an email body template into literal text and variable names once
+
+    Args:
+        template: Email body template with {variables}
+
+    Returns:
+        List of (text, variable) pairs with the greeting prepended;
+        variable is None for the trailing text
+    """
+    # Add greeting at the beginning
+    body = "Dear {first_name} {last_name},\n\n" + template
+
+    # Only known variables are split out, other braces stay literal text
+    pieces = _VAR_RE.split(body)
+    return list(zip(pieces[::2], pieces[1::2] + [None]))
+
+
 def format_email_body(template, recipient):
     """
     Replace template variables with recipient data
 
     Args:
-        template: Email body template with {variables}
-        recipient: Dictionary with email, first_name, last_name
+        template: Compiled template from compile_template
+        recipient: Recipient with email, first_name, last_name
 
     Returns:
         Formatted email body with greeting prepended
     """
-    # Add greeting at the beginning
-    greeting = f"Dear {recipient['first_name']} {recipient['last_name']},\n\n"
+    return "".join(
+        text + getattr(recipient, variable) if variable else text
+        for text, variable in template
+    )
 
-    # Combine greeting with template body
-    body = greeting + template
 
-    # Replace any remaining template variables
-    body = body.replace("{email}", recipient["email"])
-    body = body.replace("{first_name}", recipient["first_name"])
-    body = body.replace("{last_name}", recipient["last_name"])
-    return body
+class ProgressReporter:
+    """
+    Thread-safe, throttled progress updates for the UI thread
 
+    Emits at most once per 0.5% of recipients or per `interval` seconds,
+    and always for the last recipient.
+    """
 
-def send_emails_smtp(
-    recipients, subject, body_template, settings, progress_callback=None
-):
+    def __init__(self, progress_callback, total, interval=0.1):
+        self.progress_callback = progress_callback
+        self.total = total
+        self.step = max(1, total // 200)
+        self.interval = interval
+        self.current = 0
+        self._last_current = 0
+        self._next_emit = time.monotonic() + interval
+        self._lock = threading.Lock()
+
+    def advance(self, message, count=1):
+        """Count `count` processed recipients and emit progress if due"""
+        with self._lock:
+            self.current += count
+            current = self.current
+            if not self.progress_callback:
+                return
+
+            now = time.monotonic()
+            if not (
+                current == self.total
+                or current - self._last_current >= self.step
+                or now >= self._next_emit
+            ):
+                return
+            self._last_current = current
+            self._next_emit = now + self.interval
+
+            # Emit under the lock so counts reach the UI in increasing order
+            self.progress_callback.emit(
+                current, self.total, f"{message} ({current}/{self.total})"
+            )
+
+
+class RateLimiter:
     """
-    Send emails via SMTP
+    Thread-safe token bucket allowing `max_per_sec` sends per second
+
+    A rate of 0 disables limiting.
     """
-    # Connect to SMTP server
+
+    def __init__(self, max_per_sec):
+        self.max_per_sec = max_per_sec
+        self._credit = float(max_per_sec)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, count=1):
+        """Block until `count` sends are allowed"""
+        if self.max_per_sec <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._credit = min(
+                self.max_per_sec,
+                self._credit + (now - self._last) * self.max_per_sec,
+            )
+            self._last = now
+            # Going negative reserves the next free slot for this caller
+            self._credit -= count
+            wait = -self._credit / self.max_per_sec
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def retry_with_backoff(send, is_transient):
+    """
+    Call send(), retrying with exponential backoff on transient errors
+
+    Args:
+        send: Callable performing one delivery attempt
+        is_transient: Callable telling whether an exception is worth retrying
+    """
+    for delay in BACKOFF_DELAYS:
+        try:
+            return send()
+        except Exception as e:
+            if not is_transient(e):
+                raise
+            time.sleep(delay)
+    return send()
+
+
+def is_transient_smtp_error(error):
+    """Whether an SMTP error asks the client to try again later"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        # Refusals at RCPT carry one (code, message) pair per recipient
+        return bool(error.recipients) and all(
+            code in TRANSIENT_SMTP_CODES for code, _ in error.recipients.values()
+        )
+    return (
+        isinstance(error, smtplib.SMTPResponseException)
+        and error.smtp_code in TRANSIENT_SMTP_CODES
+    )
+
+
+def is_fatal_smtp_error(error):
+    """Whether an SMTP error will also fail every remaining message"""
+    # A rejected sender address fails every message; a rejected recipient
+    # (e.g. 550 on RCPT) only fails that one and is left to the ratio check
+    return isinstance(error, smtplib.SMTPSenderRefused) or (
+        isinstance(error, smtplib.SMTPResponseException)
+        and error.smtp_code in FATAL_SMTP_CODES
+    )
+
+
+def connect_smtp(settings):
+    """Open and authenticate one SMTP connection"""
+    server = smtplib.SMTP(settings["smtp_server"], settings["smtp_port"])
     try:
         if settings["use_tls"]:
-            server = smtplib.SMTP(settings["smtp_server"], settings["smtp_port"])
             server.starttls()
-        else:
-            server = smtplib.SMTP(settings["smtp_server"], settings["smtp_port"])
-
         server.login(settings["sender_email"], settings["sender_password"])
+    except Exception:
+        server.close()
+        raise
+    return server
 
-    except Exception as e:
-        raise Exception(f"Failed to connect to SMTP server: {str(e)}")
-
-    # Send emails
-    total = len(recipients)
-    failed = []
 
+def quit_smtp(server):
+    """Close an SMTP connection, ignoring errors from a dead socket"""
     try:
-        for i, recipient in enumerate(recipients):
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+class SMTPConn:
+    """
+    One authenticated SMTP connection that reconnects when needed
+
+    The connection is replaced after `messages_per_connection` sends, checked
+    with NOOP after sitting idle, and rebuilt once if the server drops it
+    in the middle of a send.
+    """
+
+    def __init__(self, settings, messages_per_connection=MESSAGES_PER_CONNECTION):
+        self.settings = settings
+        self.messages_per_connection = messages_per_connection
+        self.server = connect_smtp(settings)
+        self.sent = 0
+        self.last_used = time.monotonic()
+
+    def reconnect(self):
+        """Replace the current connection with a fresh one"""
+        self.close()
+        self.server = connect_smtp(self.settings)
+        self.sent = 0
+
+    def ensure(self):
+        """Make sure the connection is usable before the next send"""
+        if self.server is None or self.sent >= self.messages_per_connection:
+            self.reconnect()
+        elif time.monotonic() - self.last_used >= IDLE_CHECK_SECONDS:
             try:
-                # Create message
-                msg = MIMEMultipart()
-                msg["From"] = settings["sender_email"]
-                msg["To"] = recipient["email"]
-                msg["Subject"] = subject
+                code, _ = self.server.noop()
+            except (smtplib.SMTPServerDisconnected, OSError):
+                code = None
+            if code != 250:
+                self.reconnect()
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        """Send one serialized message, reconnecting once if the server hung up"""
+        self.ensure()
+        self.sent += 1
+        try:
+            return self.server.sendmail(from_addr, to_addrs, msg)
+        except smtplib.SMTPServerDisconnected:
+            self.reconnect()
+            self.sent += 1
+            return self.server.sendmail(from_addr, to_addrs, msg)
+        finally:
+            self.last_used = time.monotonic()
+
+    def close(self):
+        """Quit the connection if it is open"""
+        if self.server is not None:
+            quit_smtp(self.server)
+            self.server = None
+
+
+class SMTPPool:
+    """Pool of SMTPConn connections shared by sending threads"""
+
+    def __init__(self, settings, size, messages_per_connection=MESSAGES_PER_CONNECTION):
+        self._idle = queue.Queue()
+
+        # Connect everything up front so a bad login fails before sending
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            connecting = [
+                executor.submit(SMTPConn, settings, messages_per_connection)
+                for _ in range(size)
+            ]
+        conns = []
+        errors = []
+        for future in connecting:
+            try:
+                conns.append(future.result())
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            for conn in conns:
+                conn.close()
+            raise errors[0]
+
+        for conn in conns:
+            self._idle.put(conn)
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        """Send one serialized message on the next free connection"""
+        conn = self._idle.get()
+        try:
+            return conn.sendmail(from_addr, to_addrs, msg)
+        finally:
+            self._idle.put(conn)
 
-                # Format body with recipient data
-                body = format_email_body(body_template, recipient)
-                msg.attach(MIMEText(body, "plain"))
+    def close(self):
+        """Quit all pooled connections"""
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+
+def summarize_failures(failed):
+    """First few failure messages, one per line"""
+    return "\n".join(failed[:5]) + (
+        f"\n... and {len(failed) - 5} more" if len(failed) > 5 else ""
+    )
+
+
+def build_header_block(sender, subject):
+    """
+    Serialize the headers shared by every message of a batch
 
-                # Send email
-                server.send_message(msg)
+    Non-ASCII subjects are RFC 2047 encoded and long headers are folded.
+    """
+    # Header round-trips long encoded subjects exactly, the modern folder
+    # can drop spaces between encoded words
+    subject_header = Header(subject, None if subject.isascii() else "utf-8")
+    return b"".join(
+        (
+            SMTP_POLICY.fold_binary(*SMTP_POLICY.header_store_parse("From", sender)),
+            b"Subject: ",
+            subject_header.encode(linesep="\r\n").encode("ascii"),
+            b"\r\nMIME-Version: 1.0\r\n",
+        )
+    )
+
+
+def build_message(email, header_block, body):
+    """
+    Build a complete plain text message as bytes
 
-                # Update progress
-                if progress_callback:
-                    progress_callback.emit(
-                        i + 1, total, f"Sent to {recipient['email']} ({i+1}/{total})"
-                    )
+    Args:
+        email: Recipient address (ASCII, checked by is_valid_email)
+        header_block: Shared headers from build_header_block
+        body: Formatted message body
 
-                # Small delay to avoid overwhelming server
-                time.sleep(0.5)
+    Returns:
+        bytes: Message with CRLF line endings, ready for sendmail
+    """
+    body = _EOL_RE.sub("\r\n", body)
+    if body.isascii():
+        content_headers = _ASCII_BODY_HEADERS
+        payload = body.encode("ascii")
+    else:
+        content_headers = _UTF8_BODY_HEADERS
+        payload = base64.encodebytes(body.encode("utf-8")).replace(b"\n", b"\r\n")
+    return b"".join(
+        (
+            b"To: ",
+            email.encode("ascii"),
+            b"\r\n",
+            header_block,
+            content_headers,
+            b"\r\n",
+            payload,
+        )
+    )
+
+
+def send_emails_smtp(
+    recipients, subject, body_template, settings, progress_callback=None
+):
+    """
+    Send emails via a pool of `workers` persistent SMTP connections
+
+    Returns:
+        dict: sent (int) and failed (list of "email: error" strings)
+
+    Raises:
+        Exception: If connecting fails, or the batch is aborted because more
+            than a third of the sends failed
+    """
+    total = recipients.height
+    workers = max(1, min(settings.get("workers", DEFAULT_WORKERS), total))
+    sender = settings["sender_email"]
+    failed = []
+    attempted = 0
+    fatal_error = None
+    lock = threading.Lock()
+    abort = threading.Event()
+    progress = ProgressReporter(progress_callback, total)
+    limiter = RateLimiter(settings.get("rate_limit", 0))
+    header_block = build_header_block(sender, subject)
+
+    try:
+        pool = SMTPPool(settings, workers)
+    except Exception as e:
+        raise Exception(f"Failed to connect to SMTP server: {str(e)}")
+
+    # Messages built ahead of the senders, bounded to limit memory use
+    work = queue.Queue(maxsize=SEND_QUEUE_SIZE)
+
+    def put(item):
+        """Queue an item, giving up if the batch aborts while the queue is full"""
+        while True:
+            try:
+                work.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if abort.is_set():
+                    return False
+
+    def build_all():
+        # Build every message (only the To header and the body differ),
+        # followed by one stop marker per sending thread
+        try:
+            for recipient in map(Recipient._make, recipients.iter_rows()):
+                if abort.is_set():
+                    break
+                body = format_email_body(body_template, recipient)
+                raw = build_message(recipient.email, header_block, body)
+                if not put((recipient.email, raw)):
+                    break
+        finally:
+            for _ in range(workers):
+                if not put(None):
+                    break
+
+    def send_all():
+        nonlocal attempted, fatal_error
+        while not abort.is_set():
+            item = work.get()
+            if item is None:
+                return
+
+            email, raw = item
+            try:
+                # Send email, backing off only when the server asks to
+                limiter.acquire()
+                retry_with_backoff(
+                    lambda: pool.sendmail(sender, [email], raw),
+                    is_transient_smtp_error,
+                )
+                with lock:
+                    attempted += 1
+                progress.advance(f"Sent to {email}")
 
             except Exception as e:
-                failed.append(f"{recipient['email']}: {str(e)}")
-                if progress_callback:
-                    progress_callback.emit(
-                        i + 1, total, f"Failed: {recipient['email']}"
-                    )
+                with lock:
+                    attempted += 1
+                    failed.append(f"{email}: {str(e)}")
+                    # Stop early when the account or server is clearly failing
+                    if is_fatal_smtp_error(e):
+                        fatal_error = fatal_error or e
+                        abort.set()
+                    elif attempted >= ABORT_MIN_SENDS and len(failed) * 3 > attempted:
+                        abort.set()
+                progress.advance(f"Failed: {email}")
 
+    try:
+        with ThreadPoolExecutor(max_workers=workers + 1) as executor:
+            futures = [executor.submit(build_all)]
+            futures += [executor.submit(send_all) for _ in range(workers)]
+            for future in futures:
+                future.result()
     finally:
-        server.quit()
+        pool.close()
 
-    # Report any failures
-    if failed:
+    if fatal_error is not None:
+        raise Exception(
+            f"Aborted after {attempted} of {total} emails, the server refused "
+            f"to send any more: {str(fatal_error)}"
+        )
+    if abort.is_set():
         raise Exception(
-            f"Failed to send to {len(failed)} recipients:\n"
-            + "\n".join(failed[:5])
-            + (f"\n... and {len(failed) - 5} more" if len(failed) > 5 else "")
+            f"Aborted after {attempted} of {total} emails: {len(failed)} failed, "
+            f"likely an account or server issue:\n" + summarize_failures(failed)
         )
 
+    return {"sent": total - len(failed), "failed": failed}
+
+
+def to_ses_template(template):
+    """
+    Convert a compiled template into an SES (Handlebars) template string
+
+    Variables use triple braces so SES inserts values without HTML escaping.
+    """
+    return "".join(
+        text.replace("{{", "\\{{") + ("{{{" + variable + "}}}" if variable else "")
+        for text, variable in template
+    )
+
 
 def send_emails_ses(
     recipients, subject, body_template, settings, progress_callback=None
 ):
     """
-    Send emails via AWS SES
+    Send emails via AWS SES bulk templated sends of up to 50 recipients
+
+    Returns:
+        dict: sent (int) and failed (list of "email: error" strings)
     """
     try:
         import boto3
@@ -237,7 +684,7 @@ def send_emails_ses(
             "boto3 is required for AWS SES. Install it with: pip install boto3"
         )
 
-    # Create SES client
+    # Create SES client (boto3 clients are thread-safe)
     try:
         ses_client = boto3.client(
             "ses",
@@ -248,51 +695,105 @@ def send_emails_ses(
     except Exception as e:
         raise Exception(f"Failed to create AWS SES client: {str(e)}")
 
+    # SES counts every destination against the account's send rate, so
+    # without a configured limit stay within the account quota
+    rate_limit = settings.get("rate_limit", 0)
+    if rate_limit <= 0:
+        try:
+            rate_limit = ses_client.get_send_quota()["MaxSendRate"]
+        except Exception:
+            rate_limit = SES_DEFAULT_SEND_RATE
+    # Don't put more destinations in one call than a second's allowance
+    batch_size = max(1, min(SES_BULK_LIMIT, int(rate_limit)))
+
+    # Register the body once, SES fills in each recipient's variables
+    template_name = f"mass-email-sender-{uuid.uuid4().hex}"
+    try:
+        ses_client.create_template(
+            Template={
+                "TemplateName": template_name,
+                "SubjectPart": subject.replace("{{", "\\{{"),
+                "TextPart": to_ses_template(body_template),
+            }
+        )
+    except ClientError as e:
+        raise Exception(
+            f"Failed to create AWS SES template: {e.response['Error']['Message']}"
+        )
+
     # Send emails
-    total = len(recipients)
+    total = recipients.height
+    chunks = -(-total // batch_size)
+    workers = max(1, min(settings.get("workers", DEFAULT_WORKERS), chunks))
     failed = []
+    lock = threading.Lock()
+    progress = ProgressReporter(progress_callback, total)
+    limiter = RateLimiter(rate_limit)
+
+    def is_throttled(error):
+        return (
+            isinstance(error, ClientError)
+            and error.response["Error"]["Code"] == "Throttling"
+        )
 
-    for i, recipient in enumerate(recipients):
+    def send_chunk(chunk):
+        emails = chunk["email"].to_list()
+        # Per-recipient template data, JSON-encoded column-wise by Polars
+        template_data = chunk.select(
+            pl.struct("email", "first_name", "last_name").struct.json_encode()
+        ).to_series()
+        destinations = [
+            {"Destination": {"ToAddresses": [email]}, "ReplacementTemplateData": data}
+            for email, data in zip(emails, template_data)
+        ]
         try:
-            # Format body with recipient data
-            body = format_email_body(body_template, recipient)
-
-            # Send email via SES
-            response = ses_client.send_email(
-                Source=settings["sender_email"],
-                Destination={"ToAddresses": [recipient["email"]]},
-                Message={
-                    "Subject": {"Data": subject, "Charset": "UTF-8"},
-                    "Body": {"Text": {"Data": body, "Charset": "UTF-8"}},
-                },
+            # Send the chunk via SES, backing off when SES throttles us
+            limiter.acquire(len(emails))
+            response = retry_with_backoff(
+                lambda: ses_client.send_bulk_templated_email(
+                    Source=settings["sender_email"],
+                    Template=template_name,
+                    DefaultTemplateData="{}",
+                    Destinations=destinations,
+                ),
+                is_throttled,
             )
-
-            # Update progress
-            if progress_callback:
-                progress_callback.emit(
-                    i + 1, total, f"Sent to {recipient['email']} ({i+1}/{total})"
-                )
-
-            # Small delay to respect SES rate limits
-            time.sleep(0.1)
-
+            statuses = response["Status"]
         except ClientError as e:
             error_msg = e.response["Error"]["Message"]
-            failed.append(f"{recipient['email']}: {error_msg}")
-            if progress_callback:
-                progress_callback.emit(i + 1, total, f"Failed: {recipient['email']}")
+            statuses = [{"Status": "Failed", "Error": error_msg}] * len(emails)
         except Exception as e:
-            failed.append(f"{recipient['email']}: {str(e)}")
-            if progress_callback:
-                progress_callback.emit(i + 1, total, f"Failed: {recipient['email']}")
+            statuses = [{"Status": "Failed", "Error": str(e)}] * len(emails)
+
+        chunk_failed = [
+            f"{email}: {status.get('Error', status['Status'])}"
+            for email, status in zip(emails, statuses)
+            if status["Status"] != "Success"
+        ]
+        if not chunk_failed:
+            message = f"Sent batch of {len(emails)}"
+        else:
+            with lock:
+                failed.extend(chunk_failed)
+            if len(chunk_failed) == len(emails):
+                message = f"Failed batch of {len(emails)}"
+            else:
+                message = f"Sent batch of {len(emails)}, {len(chunk_failed)} failed"
+        progress.advance(message, count=len(emails))
 
-    # Report any failures
-    if failed:
-        raise Exception(
-            f"Failed to send to {len(failed)} recipients:\n"
-            + "\n".join(failed[:5])
-            + (f"\n... and {len(failed) - 5} more" if len(failed) > 5 else "")
-        )
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batches = recipients.iter_slices(batch_size)
+            for _ in executor.map(send_chunk, batches):
+                pass
+    finally:
+        try:
+            ses_client.delete_template(TemplateName=template_name)
+        except Exception:
+            # Don't hide the batch result behind a cleanup failure
+            pass
+
+    return {"sent": total - len(failed), "failed": failed}
 
 
 def send_emails(recipients, subject, body_template, settings, progress_callback=None):
@@ -300,17 +801,22 @@ def send_emails(recipients, subject, body_template, settings, progress_callback=
     Send emails to all recipients using the configured provider
 
     Args:
-        recipients: List of recipient dictionaries
+        recipients: Recipients DataFrame as returned by load_csv
         subject: Email subject
-        body_template: Email body template with variables
+        body_template: Email body template compiled with compile_template
         settings: Settings dictionary (SMTP or AWS SES)
         progress_callback: Optional callback function for progress updates
+
+    Returns:
+        dict: sent (int) and failed (list of "email: error" strings)
     """
     provider = settings.get("provider", "smtp")
 
     if provider == "ses":
-        send_emails_ses(recipients, subject, body_template, settings, progress_callback)
+        return send_emails_ses(
+            recipients, subject, body_template, settings, progress_callback
+        )
     else:
-        send_emails_smtp(
+        return send_emails_smtp(
             recipients, subject, body_template, settings, progress_callback
         )